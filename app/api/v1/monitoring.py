@@ -4,7 +4,9 @@ from datetime import datetime
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.core.admission import admission_stats
 from app.core.database import check_db_connection
+from app.core.executor import parse_executor
 
 router = APIRouter()
 
@@ -43,3 +45,66 @@ async def health_check() -> HealthCheckResponse:
         platform=sys.platform,
         database=db_status,
     )
+
+
+class AdmissionStatsResponse(BaseModel):
+    """Admission control counters schema."""
+    admitted: int
+    shed_rate_limited: int
+    shed_overloaded: int
+    in_flight: int
+    queued: int
+
+
+@router.get(
+    "/admission",
+    response_model=AdmissionStatsResponse,
+    status_code=200,
+    tags=["Monitoring"],
+    summary="Admission Control Stats",
+    description="Counters for admitted requests and traffic shed by rate limiting or overload.",
+)
+async def admission_stats_endpoint() -> AdmissionStatsResponse:
+    """
+    Report how much traffic the admission control middleware admitted and shed.
+    
+    Returns:
+        AdmissionStatsResponse: Counters since process start plus current in-flight and queued requests.
+    """
+    return AdmissionStatsResponse(**admission_stats.snapshot())
+
+
+class ExecutorStatsResponse(BaseModel):
+    """Parse executor queue depth and timing schema."""
+    kind: str
+    max_workers: int
+    submitted: int
+    completed: int
+    failed: int
+    pending: int
+    avg_queue_ms: float
+    avg_run_ms: float
+    max_run_ms: float
+    pool_restarts: int
+
+
+@router.get(
+    "/executor",
+    response_model=ExecutorStatsResponse,
+    status_code=200,
+    tags=["Monitoring"],
+    summary="Parse Executor Stats",
+    description="Queue depth and task timing of the worker pool used for CPU-bound parsing.",
+)
+async def executor_stats_endpoint() -> ExecutorStatsResponse:
+    """
+    Report queue depth and timing for CPU-bound parse and transform tasks.
+    
+    Returns:
+        ExecutorStatsResponse: Pool configuration plus counters since process start.
+    """
+    return ExecutorStatsResponse(
+        kind=parse_executor.kind,
+        max_workers=parse_executor.max_workers,
+        **parse_executor.stats.snapshot(),
+    )
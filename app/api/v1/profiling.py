@@ -0,0 +1,66 @@
+"""Admin endpoints for listing and downloading request profiles."""
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.profiling import has_profiling_token, profile_store
+from app.schemas.profiling import ProfileInfo, ProfileListResponse
+
+
+def require_profiling_token(
+    x_profile_token: str | None = Header(None, description="Profiling admin token"),
+) -> None:
+    """Allow access only when profiling is enabled and the token matches."""
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    if not has_profiling_token(x_profile_token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["Admin"],
+    dependencies=[Depends(require_profiling_token)],
+)
+
+
+@router.get(
+    "",
+    response_model=ProfileListResponse,
+    status_code=200,
+    summary="List Profiles",
+    description="List stored request profiles, newest first.",
+)
+async def list_profiles() -> ProfileListResponse:
+    """
+    List request profiles kept in the on-disk ring buffer.
+    
+    Returns:
+        ProfileListResponse: Stored profiles with size and creation time.
+    """
+    profiles = [ProfileInfo(**p) for p in profile_store.list()]
+    return ProfileListResponse(profiles=profiles, total_count=len(profiles))
+
+
+@router.get(
+    "/{name}",
+    response_class=FileResponse,
+    status_code=200,
+    summary="Download Profile",
+    description="Download a stored profile in pstats format.",
+)
+async def download_profile(name: str) -> FileResponse:
+    """
+    Download one profile; load it with `pstats.Stats(path)` or snakeviz.
+    
+    Path Parameters:
+        name: Profile name as returned by the list endpoint or the X-Profile-Id header.
+    
+    Returns:
+        FileResponse: The pstats file.
+    """
+    path = profile_store.path_for(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {name}")
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
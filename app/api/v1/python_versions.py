@@ -1,9 +1,13 @@
 """Python version tracking and comparison endpoints."""
 
-from fastapi import APIRouter, Query
+from datetime import date, datetime, time
+
+from fastapi import APIRouter, HTTPException, Query
 
 from app.services.python_versions import PythonVersionService
 from app.schemas.versions import (
+    BatchComparisonRequest,
+    BatchComparisonResponse,
     PythonVersionsListResponse,
     PythonVersionsComparisonResponse,
 )
@@ -16,7 +20,10 @@ router = APIRouter(prefix="/python-versions", tags=["Python Versions"])
     response_model=PythonVersionsListResponse,
     status_code=200,
     summary="Get Python Versions",
-    description="Fetch all Python versions from GitHub with major/minor version bump tracking.",
+    description=(
+        "Fetch Python versions with major/minor version bump tracking, "
+        "filtered by release date range, major.minor series and stability."
+    ),
 )
 async def get_python_versions(
     include_all_releases: bool = Query(
@@ -27,24 +34,75 @@ async def get_python_versions(
         10,
         ge=1,
         le=30,
-        description="Number of years to look back. Default: 10 years."
+        description=(
+            "Number of years to look back from `until` (or today). "
+            "Default: 10 years. Ignored when `since` is set."
+        )
+    ),
+    since: date | None = Query(
+        None,
+        description="Only releases on or after this date (YYYY-MM-DD)."
+    ),
+    until: date | None = Query(
+        None,
+        description="Only releases on or before this date (YYYY-MM-DD)."
+    ),
+    series: str | None = Query(
+        None,
+        pattern=r"^\d+\.\d+$",
+        description="Only releases of this major.minor series (e.g. 3.12)."
     ),
 ) -> PythonVersionsListResponse:
     """
-    Get all Python versions from GitHub with version bump indicators.
+    Get Python versions with version bump indicators.
     
     Shows major and minor version bumps for each release.
     Includes release dates and EOL information.
     
     Query Parameters:
         include_all_releases: If True, includes alpha/beta/rc releases.
-        years: Number of years to look back (1-30).
+        years: Number of years to look back from `until` or today (1-30).
+        since: Earliest release date to include.
+        until: Latest release date to include.
+        series: major.minor series to include.
     
     Returns:
         PythonVersionsListResponse: List of versions with bump indicators.
     """
+    if since and until and since > until:
+        raise HTTPException(status_code=400, detail="`since` must not be after `until`")
+    
     return await PythonVersionService.get_python_versions(
         include_all_releases=include_all_releases,
         years=years,
+        since=datetime.combine(since, time.min) if since else None,
+        until=datetime.combine(until, time.max) if until else None,
+        series=series,
     )
 
+
+@router.post(
+    "/compare/batch",
+    response_model=BatchComparisonResponse,
+    status_code=200,
+    summary="Batch Compare Python Versions",
+    description=(
+        "Compare a list of (from, to) version pairs, or every pair of a version set "
+        "as an N x N matrix, in a single call."
+    ),
+)
+async def compare_python_versions_batch(
+    request: BatchComparisonRequest,
+) -> BatchComparisonResponse:
+    """
+    Compare many stable Python versions at once.
+    
+    Request Body:
+        pairs: (from_version, to_version) pairs, or
+        versions: Version set expanded into an N x N matrix.
+        include_versions_in_between: Whether to list intermediate versions.
+    
+    Returns:
+        BatchComparisonResponse: One comparison per pair whose versions are known.
+    """
+    return await PythonVersionService.compare_versions_batch(request)
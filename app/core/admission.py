@@ -0,0 +1,176 @@
+"""Admission control and load shedding for the API.
+
+A global limit caps how many requests run at once, and each client can
+optionally get a token bucket. A request that would wait longer than the
+queueing target for a slot is rejected with 429 and ``Retry-After``. That
+keeps a single noisy client or a refresh stampede from raising everyone's
+latency.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AdmissionStats:
+    """Counters describing admitted and shed traffic."""
+
+    def __init__(self) -> None:
+        self.admitted = 0
+        self.shed_rate_limited = 0
+        self.shed_overloaded = 0
+        self.in_flight = 0
+        self.queued = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "admitted": self.admitted,
+            "shed_rate_limited": self.shed_rate_limited,
+            "shed_overloaded": self.shed_overloaded,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+        }
+
+
+# Shared by the middleware and the monitoring endpoint
+admission_stats = AdmissionStats()
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float, now: float) -> None:
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, rate: float, capacity: float, now: float) -> float:
+        """Take one token; return 0 on success or the seconds until one is available."""
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware enforcing per-client rate limits and a global concurrency cap."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_per_second: float = 10.0,
+        burst: int = 20,
+        max_concurrency: int = 32,
+        queue_target_ms: float = 500.0,
+        max_queue: int = 64,
+        max_tracked_clients: int = 10000,
+        per_client_limit: bool = True,
+        trusted_proxy_hops: int = 0,
+        exempt_paths: list[str] | None = None,
+        stats: AdmissionStats = admission_stats,
+    ) -> None:
+        self.app = app
+        self.rate = rate_per_second
+        self.burst = float(burst)
+        self.max_concurrency = max_concurrency
+        self.queue_target = queue_target_ms / 1000
+        self.max_queue = max_queue
+        self.max_tracked_clients = max_tracked_clients
+        self.per_client_limit = per_client_limit
+        self.trusted_proxy_hops = trusted_proxy_hops
+        self.exempt_paths = frozenset(exempt_paths or ())
+        self.stats = stats
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._buckets: OrderedDict[str, _TokenBucket] = OrderedDict()
+
+    def _client_id(self, scope: Scope) -> str:
+        """Key the client by the address our own proxies saw.
+
+        Each trusted proxy appends the address it received the request from to
+        X-Forwarded-For, so with N trusted hops the client is the Nth entry from
+        the right. Entries further left are client-controlled and ignored.
+        """
+        if self.trusted_proxy_hops > 0:
+            hops = [
+                hop.strip()
+                for name, value in scope.get("headers", ())
+                if name == b"x-forwarded-for"
+                for hop in value.decode("latin-1").split(",")
+            ]
+            if len(hops) >= self.trusted_proxy_hops:
+                return hops[-self.trusted_proxy_hops]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _retry_after_rate_limit(self, client_id: str) -> float:
+        """Charge the client's bucket; return 0 if admitted, else seconds to wait."""
+        now = time.monotonic()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = _TokenBucket(self.burst, now)
+            self._buckets[client_id] = bucket
+            # Forget the least recently seen clients so the table stays bounded
+            while len(self._buckets) > self.max_tracked_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client_id)
+        return bucket.take(self.rate, self.burst, now)
+
+    async def _reject(self, send: Send, detail: str, retry_after: float) -> None:
+        body = json.dumps({"detail": detail, "status_code": 429}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = 0.0
+        if self.per_client_limit:
+            retry_after = self._retry_after_rate_limit(self._client_id(scope))
+        if retry_after:
+            self.stats.shed_rate_limited += 1
+            await self._reject(send, "Rate limit exceeded", retry_after)
+            return
+
+        if self._slots.locked():
+            # Reject without waiting once the queue is already full
+            if self.stats.queued >= self.max_queue:
+                self.stats.shed_overloaded += 1
+                await self._reject(send, "Server overloaded", self.queue_target)
+                return
+            self.stats.queued += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_target)
+            except asyncio.TimeoutError:
+                self.stats.shed_overloaded += 1
+                await self._reject(send, "Server overloaded", self.queue_target)
+                return
+            finally:
+                self.stats.queued -= 1
+        else:
+            await self._slots.acquire()
+
+        self.stats.admitted += 1
+        self.stats.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.stats.in_flight -= 1
+            self._slots.release()
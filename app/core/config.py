@@ -1,4 +1,6 @@
 import logging
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,9 +13,49 @@ class Settings(BaseSettings):
     host: str = "localhost"
     port: int = 8000
     
+    # Startup Configuration
+    # Import heavy dependencies in the background once the server is up
+    warm_up_imports: bool = True
+    
+    # Parse Executor Configuration
+    # "process" or "thread"; html.parser holds the GIL, so threads still
+    # compete with request handling
+    parse_executor: Literal["process", "thread"] = "process"
+    parse_executor_workers: int | None = None  # defaults to min(4, CPU count)
+    
+    # Release Snapshot Configuration
+    # Baked at image build time by `python -m app.services.snapshot`
+    snapshot_path: str = "data/python/releases.snapshot"
+    # Re-scrape python.org in the background after serving from the snapshot
+    snapshot_refresh_on_startup: bool = True
+    
+    # Profiling Configuration
+    # The middleware is only installed when enabled
+    profiling_enabled: bool = False
+    profiling_header: str = "X-Profile"  # value must equal profiling_token
+    profiling_token: str | None = None  # also required by the admin profile endpoints
+    profiling_sample_rate: float = 0.0  # fraction of requests profiled without the header
+    profiling_dir: str = "data/profiles"
+    profiling_max_profiles: int = 50
+    
     # Logging Configuration
     log_level: str = "INFO"
     
+    # Admission Control Configuration
+    admission_enabled: bool = True
+    admission_rate_per_second: float = 10.0  # per-client token refill rate
+    admission_burst: int = 20  # per-client token bucket capacity
+    admission_max_concurrency: int = 32  # requests handled at once
+    admission_queue_target_ms: float = 500.0  # max wait for a slot before shedding
+    admission_max_queue: int = 64  # requests allowed to wait for a slot
+    admission_max_tracked_clients: int = 10000
+    # Per-client token buckets. Off by default: behind the cluster load balancer
+    # every caller shares the proxy's address unless admission_trusted_proxy_hops
+    # is set to the number of proxies that append to X-Forwarded-For.
+    admission_per_client_limit: bool = False
+    admission_trusted_proxy_hops: int = 0
+    admission_exempt_paths: list[str] = ["/api/v1/health", "/api/v1/admission", "/api/v1/executor"]
+    
     # CORS Configuration
     allowed_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
     
@@ -1,17 +1,23 @@
 import asyncio
 import ssl
 import urllib.parse
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 # Key Vault Details
 VAULT_URL = "https://techtrackr-vault.vault.azure.net/"
 
+# The engine is created on first use so that importing the app does not pull in
+# the Azure SDK and SQLAlchemy asyncio or block on Key Vault lookups.
+_engine: "AsyncEngine | None" = None
+
 def _get_keyvault_secret(secret_name: str) -> str:
     """Retrieve secret and immediately strip whitespace."""
+    from azure.identity import DefaultAzureCredential
+    from azure.keyvault.secrets import SecretClient
+
     credential = DefaultAzureCredential()
     client = SecretClient(vault_url=VAULT_URL, credential=credential)
     # .strip() prevents 'nodename not known' errors caused by hidden spaces
@@ -32,19 +38,31 @@ def get_database_url() -> str:
     print(f"DEBUG: Resolving Host: |{clean_host}|")
     
     return f"postgresql+asyncpg://{safe_user}:{safe_pass}@{clean_host}:{db_port}/postgres"
-# Setup SSL Context to allow Azure's certificates
-ssl_ctx = ssl.create_default_context()
-ssl_ctx.check_hostname = False
-ssl_ctx.verify_mode = ssl.CERT_NONE
 
-engine = create_async_engine(
-    get_database_url(),
-    connect_args={"ssl": ssl_ctx},
-    pool_pre_ping=True
-)
+def get_engine() -> "AsyncEngine":
+    """Return the shared async engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        # Setup SSL Context to allow Azure's certificates
+        ssl_ctx = ssl.create_default_context()
+        ssl_ctx.check_hostname = False
+        ssl_ctx.verify_mode = ssl.CERT_NONE
+
+        _engine = create_async_engine(
+            get_database_url(),
+            connect_args={"ssl": ssl_ctx},
+            pool_pre_ping=True
+        )
+    return _engine
 
 async def check_db_connection():
     try:
+        from sqlalchemy import text
+
+        # Key Vault lookups are blocking; keep them off the event loop
+        engine = await asyncio.to_thread(get_engine)
         async with engine.begin() as conn:
             await conn.execute(text("SELECT 1"))
         print("Success: TechTrackr is connected to Azure Postgres!")
@@ -54,4 +72,4 @@ async def check_db_connection():
         return False
 
 if __name__ == "__main__":
-    asyncio.run(check_db_connection())
\ No newline at end of file
+    asyncio.run(check_db_connection())
@@ -0,0 +1,192 @@
+"""Worker pool for CPU-bound parse and transform stages.
+
+HTML parsing and fuzzy date parsing are CPU-bound and would freeze the event
+loop if run inline. They run through ``parse_executor``, a
+process pool (the default) or a thread pool chosen by ``Settings.parse_executor``.
+BeautifulSoup's ``html.parser`` is pure Python and holds the GIL, so only the
+process pool keeps parsing from slowing request handling. The app lifespan
+owns the pool. Functions sent to a process pool must be importable and take
+and return plain picklable data. Short stages (snapshot decode, index build)
+use ``asyncio.to_thread`` instead, so startup never waits on spawning workers.
+"""
+
+import asyncio
+import cProfile
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.profiling import worker_profiles
+from app.core.warmup import PARSE_MODULES, warm_up_imports
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def _timed_call(
+    fn: Callable[..., T],
+    args: tuple,
+    profile: bool = False,
+) -> tuple[float, float, T, dict | None]:
+    """Run ``fn`` in the worker and return its wall-clock start, duration, result
+    and, if ``profile`` is set, its raw cProfile stats."""
+    profiler = None
+    if profile:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one profiler per interpreter; the request's
+            # own profiler already sees this thread then.
+            profiler = None
+
+    started_at = time.time()
+    try:
+        result = fn(*args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    duration = time.time() - started_at
+
+    stats = None
+    if profiler is not None:
+        profiler.create_stats()
+        stats = profiler.stats
+    return started_at, duration, result, stats
+
+
+class ExecutorStats:
+    """Queue depth and task timing for the parse executor."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_queue_ms = 0.0
+        self.total_run_ms = 0.0
+        self.max_run_ms = 0.0
+        self.pool_restarts = 0
+
+    @property
+    def pending(self) -> int:
+        """Tasks submitted but not yet finished (queued or running)."""
+        return self.submitted - self.completed - self.failed
+
+    def snapshot(self) -> dict[str, Any]:
+        finished = self.completed or 1
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": self.pending,
+            "avg_queue_ms": self.total_queue_ms / finished,
+            "avg_run_ms": self.total_run_ms / finished,
+            "max_run_ms": self.max_run_ms,
+            "pool_restarts": self.pool_restarts,
+        }
+
+
+class ParseExecutor:
+    """Runs CPU-bound callables off the event loop and records their timing."""
+
+    def __init__(self, kind: str = "process", max_workers: int | None = None) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"parse_executor must be one of {EXECUTOR_KINDS}, got {kind!r}")
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.stats = ExecutorStats()
+        self._executor: Executor | None = None
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        if self.kind == "process":
+            # spawn avoids forking a process that is running an event loop;
+            # each worker imports the parse modules as it starts
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_up_imports,
+                initargs=(PARSE_MODULES,),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="parse",
+            )
+        logger.info(f"Started {self.kind} parse executor with {self.max_workers} workers")
+
+    def warm_up(self) -> None:
+        """Get workers ready so the first parse doesn't pay for startup.
+
+        Spawns every process worker, which imports the parse modules on
+        start. Thread workers share the parent's modules, so the parse
+        modules are imported once on a pool thread. Returns without waiting.
+        """
+        if self._executor is None:
+            self.start()
+        executor = self._executor
+        if self.kind == "process":
+            for _ in range(self.max_workers):
+                executor.submit(int)
+        else:
+            executor.submit(warm_up_imports, PARSE_MODULES)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _restart_broken(self, broken: Executor) -> None:
+        """Replace ``broken`` with a fresh pool unless another task already did."""
+        if self._executor is not broken:
+            return
+        logger.error("Parse executor pool broke (worker died); restarting it")
+        self.stats.pool_restarts += 1
+        self.shutdown()
+        self.start()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` in the pool; starts the pool on first use outside the app.
+
+        If a worker process dies, the pool is rebuilt for later calls and this
+        call raises ``BrokenProcessPool``.
+        """
+        if self._executor is None:
+            self.start()
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        profiles = worker_profiles.get()
+        submitted_at = time.time()
+        self.stats.submitted += 1
+        try:
+            started_at, duration, result, profile_stats = await loop.run_in_executor(
+                executor, _timed_call, fn, args, profiles is not None
+            )
+        except BrokenProcessPool:
+            self.stats.failed += 1
+            self._restart_broken(executor)
+            raise
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        if profile_stats is not None:
+            profiles.append(profile_stats)
+        run_ms = duration * 1000
+        self.stats.completed += 1
+        self.stats.total_queue_ms += max(0.0, started_at - submitted_at) * 1000
+        self.stats.total_run_ms += run_ms
+        self.stats.max_run_ms = max(self.stats.max_run_ms, run_ms)
+        return result
+
+
+parse_executor = ParseExecutor(settings.parse_executor, settings.parse_executor_workers)
@@ -0,0 +1,179 @@
+"""Opt-in per-request profiling.
+
+When ``Settings.profiling_enabled`` is set, a request is run under cProfile
+if it carries the privileged profiling header or is picked by the sampling
+rate. CPU-bound work the request hands to the parse executor is profiled in
+the worker and merged in. Each profile is written in pstats format to a
+bounded on-disk ring buffer, and the admin endpoints list and download the
+files. When profiling is disabled the middleware is not installed at all, so
+other requests pay nothing.
+"""
+
+import asyncio
+import cProfile
+import logging
+import pstats
+import random
+import re
+import secrets
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = ".pstats"
+# Names we generate; anything else is rejected to keep lookups inside the directory
+PROFILE_NAME_PATTERN = re.compile(r"^\d+-[A-Z]+-[A-Za-z0-9_-]+\.pstats$")
+
+
+# Raw cProfile stats from executor tasks submitted by the request being
+# profiled; None when the current request is not profiled.
+worker_profiles: ContextVar[list[dict] | None] = ContextVar("worker_profiles", default=None)
+
+
+class _RawStats:
+    """Adapter letting ``pstats.Stats.add`` accept a raw stats dict from a worker."""
+
+    def __init__(self, stats: dict) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+def has_profiling_token(value: str | None) -> bool:
+    """Return whether ``value`` matches the configured profiling token.
+
+    Compares bytes: ``compare_digest`` raises on non-ASCII ``str`` input, and
+    header values are client-controlled. Headers arrive latin-1 decoded, so
+    encoding them back gives the raw bytes.
+    """
+    token = settings.profiling_token
+    if not token or not value:
+        return False
+    try:
+        raw = value.encode("latin-1")
+    except UnicodeEncodeError:
+        return False
+    return secrets.compare_digest(raw, token.encode("utf-8"))
+
+
+class ProfileStore:
+    """Ring buffer of pstats files in a directory, keeping the newest ``max_profiles``."""
+
+    def __init__(self, directory: Path, max_profiles: int) -> None:
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def new_name(self, method: str, path: str) -> str:
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", path.strip("/"))[:80] or "root"
+        return f"{time.time_ns()}-{method.upper()}-{slug}{PROFILE_SUFFIX}"
+
+    def save(self, profiler: cProfile.Profile, name: str, extra: list[dict] | None = None) -> None:
+        """Write the profile, merged with ``extra`` worker stats, and drop the
+        oldest files beyond ``max_profiles``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stats = pstats.Stats(profiler)
+        for raw in extra or ():
+            stats.add(_RawStats(raw))
+        stats.dump_stats(self.directory / name)
+        for stale in self._paths()[self.max_profiles:]:
+            stale.unlink(missing_ok=True)
+
+    def _paths(self) -> list[Path]:
+        """Profile files, newest first (names start with a nanosecond timestamp)."""
+        if not self.directory.is_dir():
+            return []
+        paths = [p for p in self.directory.iterdir() if PROFILE_NAME_PATTERN.match(p.name)]
+        return sorted(paths, key=lambda p: int(p.name.split("-", 1)[0]), reverse=True)
+
+    def list(self) -> list[dict]:
+        profiles = []
+        for p in self._paths():
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            profiles.append({
+                "name": p.name,
+                "size_bytes": stat.st_size,
+                "created_at": int(p.name.split("-", 1)[0]) / 1e9,
+            })
+        return profiles
+
+    def path_for(self, name: str) -> Path | None:
+        """Return the file for ``name`` if it is a stored profile, else None."""
+        if not PROFILE_NAME_PATTERN.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+
+profile_store = ProfileStore(Path(settings.profiling_dir), settings.profiling_max_profiles)
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles selected requests with cProfile."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header: str = "X-Profile",
+        sample_rate: float = 0.0,
+        exempt_prefixes: list[str] | None = None,
+        store: ProfileStore = profile_store,
+    ) -> None:
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+        self.sample_rate = sample_rate
+        self.exempt_prefixes = tuple(exempt_prefixes or ())
+        self.store = store
+        # cProfile cannot run two profilers at once; concurrent picks run unprofiled
+        self._active = False
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if scope["path"].startswith(self.exempt_prefixes):
+            return False
+        for name, value in scope.get("headers", ()):
+            if name == self.header:
+                return has_profiling_token(value.decode("latin-1"))
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = self.store.new_name(scope["method"], scope["path"])
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", name.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        # cProfile records the whole thread, so work from other tasks that runs
+        # on the event loop while this request is in flight shows up as well.
+        # Parse executor tasks profile themselves and report back through
+        # worker_profiles, since they run on other threads or processes.
+        self._active = True
+        extra: list[dict] = []
+        token = worker_profiles.set(extra)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.disable()
+            worker_profiles.reset(token)
+            self._active = False
+            try:
+                await asyncio.to_thread(self.store.save, profiler, name, extra)
+            except OSError as e:
+                logger.warning(f"Could not write profile {name}: {e}")
@@ -0,0 +1,48 @@
+"""Background warm-up of heavy dependencies.
+
+The app imports its heavy dependencies lazily so the server can bind its port
+quickly. Once startup has finished, these modules are imported in a worker
+thread so the first scrape or DB request does not pay for them.
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Modules deferred out of the import path of ``app.main``, by where they are used.
+# Parse modules are used by the parse executor; process workers import them
+# when they start (see ``ParseExecutor.warm_up``).
+PARENT_MODULES: tuple[str, ...] = (
+    "httpx",
+    "sqlalchemy.ext.asyncio",
+    "azure.identity",
+    "azure.keyvault.secrets",
+)
+PARSE_MODULES: tuple[str, ...] = (
+    "bs4",
+    "dateutil.parser",
+)
+HEAVY_MODULES: tuple[str, ...] = PARENT_MODULES + PARSE_MODULES
+
+
+def warm_up_imports(modules: tuple[str, ...] = HEAVY_MODULES) -> dict[str, float]:
+    """Import the given modules and return the time spent on each in milliseconds."""
+    timings: dict[str, float] = {}
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.warning(f"Warm-up import of {name} failed: {e}")
+            continue
+        timings[name] = (time.perf_counter() - started) * 1000
+    return timings
+
+
+async def warm_up_in_background(modules: tuple[str, ...] = PARENT_MODULES) -> None:
+    """Run ``warm_up_imports`` off the event loop and log the result."""
+    timings = await asyncio.to_thread(warm_up_imports, modules)
+    logger.info(f"Warm-up imports finished in {sum(timings.values()):.1f} ms")
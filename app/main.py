@@ -1,15 +1,22 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
-import uvicorn
 
+from app.core.admission import AdmissionControlMiddleware
 from app.core.config import settings
+from app.core.executor import parse_executor
 from app.core.logging import setup_logging
+from app.core.profiling import ProfilingMiddleware
+from app.core.warmup import warm_up_in_background
+from app.services.python_versions import PythonVersionService
 from app.api.v1.monitoring import router as monitoring_router
+from app.api.v1.profiling import router as profiling_router
 from app.api.v1.python_versions import router as python_versions_router
 
 
@@ -23,13 +30,24 @@ async def lifespan(app: FastAPI):
     """Application lifespan context manager for startup and shutdown events."""
     # Startup
     logger.info("Application starting up")
-    pass
+    parse_executor.start()
+    background_tasks: list[asyncio.Task] = []
+    # Serve the baked snapshot right away and refresh it behind the scenes
+    if await PythonVersionService.load_snapshot() and settings.snapshot_refresh_on_startup:
+        background_tasks.append(asyncio.create_task(PythonVersionService.refresh_index()))
+    # Warm up last so it doesn't compete with startup for the GIL
+    if settings.warm_up_imports:
+        background_tasks.append(asyncio.create_task(asyncio.to_thread(parse_executor.warm_up)))
+        background_tasks.append(asyncio.create_task(warm_up_in_background()))
     
     yield
     
     # Shutdown
     logger.info("Application shutting down")
-    pass
+    for task in background_tasks:
+        if not task.done():
+            task.cancel()
+    parse_executor.shutdown()
 
 
 app = FastAPI(
@@ -40,6 +58,32 @@ app = FastAPI(
 )
 
 
+# Profiling Middleware (innermost, so only admitted requests are profiled)
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        header=settings.profiling_header,
+        sample_rate=settings.profiling_sample_rate,
+        exempt_prefixes=["/api/v1/admin/profiles"],
+    )
+
+
+# Admission Control Middleware (inside CORS so rejections still carry CORS headers)
+if settings.admission_enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        rate_per_second=settings.admission_rate_per_second,
+        burst=settings.admission_burst,
+        max_concurrency=settings.admission_max_concurrency,
+        queue_target_ms=settings.admission_queue_target_ms,
+        max_queue=settings.admission_max_queue,
+        max_tracked_clients=settings.admission_max_tracked_clients,
+        per_client_limit=settings.admission_per_client_limit,
+        trusted_proxy_hops=settings.admission_trusted_proxy_hops,
+        exempt_paths=settings.admission_exempt_paths,
+    )
+
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -67,7 +111,7 @@ async def validation_exception_handler(request, exc: RequestValidationError):
     logger.error(f"Validation Error: {exc.errors()}")
     return JSONResponse(
         status_code=422,
-        content={"detail": exc.errors(), "status_code": 422},
+        content={"detail": jsonable_encoder(exc.errors()), "status_code": 422},
     )
 
 
@@ -84,9 +128,12 @@ async def general_exception_handler(request, exc: Exception):
 # Include routers with common API prefix
 app.include_router(monitoring_router, prefix="/api/v1", tags=["Monitoring"])
 app.include_router(python_versions_router, prefix="/api/v1")
+app.include_router(profiling_router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
         host=settings.host,
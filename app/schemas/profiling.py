@@ -0,0 +1,16 @@
+"""Pydantic schemas for the request profiling admin endpoints."""
+
+from pydantic import BaseModel, Field
+
+
+class ProfileInfo(BaseModel):
+    """A stored request profile."""
+    name: str = Field(..., description="Profile file name, used to download it")
+    size_bytes: int = Field(..., description="Size of the pstats file in bytes")
+    created_at: float = Field(..., description="Unix timestamp when the profile was written")
+
+
+class ProfileListResponse(BaseModel):
+    """Response for listing stored profiles."""
+    profiles: list[ProfileInfo] = Field(..., description="Stored profiles, newest first")
+    total_count: int = Field(..., description="Number of stored profiles")
@@ -1,7 +1,7 @@
 """Pydantic schemas for Python version tracking."""
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class PythonReleaseInfo(BaseModel):
@@ -27,7 +27,13 @@ class PythonVersionsListResponse(BaseModel):
         False,
         description="Whether the list includes all releases or only stable ones"
     )
-    time_range_years: int = Field(10, description="Number of years of versions included")
+    time_range_years: int | None = Field(
+        10,
+        description="Number of years of versions included; null when `since` was given"
+    )
+    since: datetime | None = Field(None, description="Earliest release date included")
+    until: datetime | None = Field(None, description="Latest release date included")
+    series: str | None = Field(None, description="major.minor series filter, if any")
 
 
 class VersionComparison(BaseModel):
@@ -50,3 +56,48 @@ class PythonVersionsComparisonResponse(BaseModel):
     """Response for version comparison."""
     comparison: VersionComparison = Field(..., description="Comparison details")
     changes_summary: str = Field(..., description="Human-readable summary of changes")
+
+
+class BatchComparisonRequest(BaseModel):
+    """Request for comparing many version pairs at once."""
+    pairs: list[tuple[str, str]] = Field(
+        default_factory=list,
+        max_length=10000,
+        description="Explicit (from_version, to_version) pairs to compare"
+    )
+    versions: list[str] = Field(
+        default_factory=list,
+        max_length=100,
+        description="Versions to compare pairwise as an N x N matrix (row-major)"
+    )
+    include_versions_in_between: bool | None = Field(
+        None,
+        description=(
+            "Whether to list the versions between each pair. "
+            "Defaults to true for `pairs` and false for `versions` matrices."
+        )
+    )
+
+    @model_validator(mode="after")
+    def check_pairs_or_versions(self) -> "BatchComparisonRequest":
+        if bool(self.pairs) == bool(self.versions):
+            raise ValueError("Provide exactly one of `pairs` or `versions`")
+        # `versions` is a set; keep first-seen order so the matrix axis is stable
+        self.versions = list(dict.fromkeys(self.versions))
+        if self.include_versions_in_between is None:
+            self.include_versions_in_between = not self.versions
+        return self
+
+
+class BatchComparisonResponse(BaseModel):
+    """Response for a batch version comparison."""
+    comparisons: list[VersionComparison] = Field(..., description="Comparison per resolvable pair")
+    versions: list[str] = Field(
+        default_factory=list,
+        description="Matrix axis when `versions` was requested; empty for explicit pairs"
+    )
+    not_found: list[str] = Field(
+        default_factory=list,
+        description="Requested versions missing from the stable release index"
+    )
+    total_count: int = Field(..., description="Number of comparisons returned")
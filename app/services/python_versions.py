@@ -1,19 +1,24 @@
-"""Service for fetching and processing Python version data from GitHub."""
+"""Service for querying and comparing Python version data scraped from python.org."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-import httpx
+from pathlib import Path
 from packaging import version
 
+from app.core.config import settings
 from app.schemas.versions import (
+    BatchComparisonRequest,
+    BatchComparisonResponse,
     PythonReleaseInfo,
     PythonVersionsListResponse,
-    VersionComparison,
     PythonVersionsComparisonResponse,
 )
 
 # Import the scraper for python.org cached data
 from app.services.python_org_scraper import PythonOrgScraper
+from app.services.release_index import ReleaseIndex, prepare_index as prepare_index_data
+from app.services.snapshot import SnapshotError, read_snapshot, write_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -29,206 +34,227 @@ PYTHON_EOL_DATES: dict[str, datetime] = {
 
 
 class PythonVersionService:
-    """Service to fetch and process Python versions from GitHub."""
+    """Service to query and compare Python versions from the release index."""
     
-    GITHUB_API_URL = "https://api.github.com/repos/python/cpython/releases"
-    GITHUB_HEADERS = {
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    # Full-history index, built once from the scraped dataset
+    _release_index: ReleaseIndex | None = None
+    # Held while building, so concurrent cold requests share one load or scrape
+    _index_lock = asyncio.Lock()
     
+    @staticmethod
+    def _to_row(item: dict) -> dict | None:
+        """Validate a cached release dict into PythonReleaseInfo fields, or None if unusable."""
+        ver = item.get("version", "")
+        try:
+            parsed = version.parse(ver)
+            if not isinstance(parsed, version.Version):
+                return None
+        except Exception:
+            return None
+
+        try:
+            release_date = datetime.fromisoformat(item.get("release_date", ""))
+        except Exception:
+            return None
+
+        major_minor = f"{parsed.major}.{parsed.minor}"
+        eol_date = item.get("eol_date") or PYTHON_EOL_DATES.get(major_minor)
+
+        try:
+            release_info = PythonReleaseInfo(
+                version=ver,
+                major=parsed.major,
+                minor=parsed.minor,
+                patch=parsed.micro,
+                release_date=release_date,
+                release_notes_url=item.get("release_notes_url") or "",
+                changelog=item.get("changelog") or "",
+                is_stable=not parsed.is_prerelease,
+                eol_date=eol_date,
+            )
+        except ValueError:
+            return None
+        return release_info.model_dump(exclude={"is_major_bump", "is_minor_bump"})
+
+    @staticmethod
+    def prepare_index(items: list[dict]) -> dict:
+        """Validate cached release dicts and sort them into plain index data.
+
+        Runs in a worker thread. It takes milliseconds, so a process-pool
+        round trip would cost more than it saves. Wrap the result in ReleaseIndex.
+        """
+        rows = []
+        for item in items:
+            row = PythonVersionService._to_row(item)
+            if row is not None:
+                rows.append(row)
+        return prepare_index_data(rows)
+
+    @staticmethod
+    def prepare_snapshot(path: Path) -> dict:
+        """Read, verify and decode a snapshot into plain index data.
+
+        Runs in a worker thread, so startup doesn't wait on the parse pool.
+
+        Raises:
+            SnapshotError: If the snapshot is missing or unusable.
+        """
+        return PythonVersionService.prepare_index(read_snapshot(path))
+
+    @staticmethod
+    def build_index(items: list[dict]) -> ReleaseIndex:
+        """Build a ReleaseIndex from cached release dicts on the calling thread."""
+        return ReleaseIndex(PythonVersionService.prepare_index(items))
+
+    @staticmethod
+    async def load_snapshot(path: Path | None = None) -> bool:
+        """Load the baked release snapshot into the index; return whether it was used."""
+        path = path or Path(settings.snapshot_path)
+        try:
+            prepared = await asyncio.to_thread(PythonVersionService.prepare_snapshot, path)
+        except SnapshotError as e:
+            logger.info(f"No usable release snapshot: {e}")
+            return False
+
+        index = ReleaseIndex(prepared)
+        if not len(index):
+            return False
+        PythonVersionService._release_index = index
+        logger.info(f"Loaded {len(index)} releases from snapshot {path}")
+        return True
+
+    @staticmethod
+    async def get_release_index() -> ReleaseIndex:
+        """Return the full-history release index.
+
+        Built from the JSON cache or the baked snapshot when available; python.org
+        is scraped only if neither exists. Concurrent callers wait for a single
+        build instead of each starting their own.
+        """
+        if PythonVersionService._release_index is not None:
+            return PythonVersionService._release_index
+
+        async with PythonVersionService._index_lock:
+            # Another request may have built it while we waited
+            if PythonVersionService._release_index is not None:
+                return PythonVersionService._release_index
+            cached = await asyncio.to_thread(PythonOrgScraper.load_cached)
+            if not cached and await PythonVersionService.load_snapshot():
+                return PythonVersionService._release_index
+            if not cached:
+                cached = await PythonOrgScraper.scrape_and_cache()
+            index = ReleaseIndex(await asyncio.to_thread(PythonVersionService.prepare_index, cached))
+            # Don't pin an empty index; retry the scrape on the next request
+            if not len(index):
+                return index
+            PythonVersionService._release_index = index
+            return index
+
+    @staticmethod
+    async def refresh_index() -> None:
+        """Re-scrape python.org, swap in the new index and update the snapshot.
+
+        Keeps serving the current index if the scrape comes back empty.
+        """
+        releases = await PythonOrgScraper.scrape_and_cache()
+        index = ReleaseIndex(await asyncio.to_thread(PythonVersionService.prepare_index, releases))
+        if not len(index):
+            logger.warning("Release refresh returned no data; keeping current index")
+            return
+
+        PythonVersionService._release_index = index
+        logger.info(f"Refreshed release index with {len(index)} releases")
+        try:
+            await asyncio.to_thread(write_snapshot, releases, Path(settings.snapshot_path))
+        except OSError as e:
+            logger.warning(f"Could not update release snapshot: {e}")
+
     @staticmethod
     async def get_python_versions(
         include_all_releases: bool = False,
         years: int = 10,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        series: str | None = None,
     ) -> PythonVersionsListResponse:
         """
-        Fetch Python versions from GitHub API.
+        Query Python versions from the release index.
         
         Args:
             include_all_releases: If True, include alpha, beta, rc releases.
                                 If False, only stable releases.
-            years: Number of years to look back from today.
+            years: Number of years to look back from `until` (or today when
+                `until` is not given). Ignored when `since` is given.
+            since: Only releases on or after this datetime.
+            until: Only releases on or before this datetime.
+            series: Only releases of this major.minor series (e.g. "3.12").
             
         Returns:
-            PythonVersionsListResponse with list of versions.
+            PythonVersionsListResponse with list of versions, newest first.
         """
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Fetch all releases from GitHub
-                all_releases = []
-                page = 1
-                per_page = 100
-                
-                while True:
-                    response = await client.get(
-                        PythonVersionService.GITHUB_API_URL,
-                        params={"per_page": per_page, "page": page},
-                        headers=PythonVersionService.GITHUB_HEADERS
-                    )
-                    
-                    if response.status_code == 404:
-                        logger.error("GitHub repository not found")
-                        raise ValueError("Python cpython repository not found on GitHub")
-                    
-                    response.raise_for_status()
-                    releases = response.json()
-                    
-                    if not releases:
-                        break
-                    
-                    all_releases.extend(releases)
-                    
-                    # If we got less than per_page results, we're at the end
-                    if len(releases) < per_page:
-                        break
-                    
-                    page += 1
-                
-                # Process releases
-                cutoff_date = datetime.utcnow() - timedelta(days=years * 365)
-                processed_versions: list[PythonReleaseInfo] = []
-                prev_version = None
-                
-                # for release in all_releases:
-                # Try loading cached scraped data first; if empty, trigger scraping
-                processed_versions: list[PythonReleaseInfo] = []
-                try:
-                    cached = PythonOrgScraper.load_cached()
-                    if not cached:
-                        cached = await PythonOrgScraper.scrape_and_cache(years=years, include_all_releases=include_all_releases)
-
-                    for item in cached:
-                        ver = item.get("version", "")
-                        try:
-                            parsed = version.parse(ver)
-                            if not isinstance(parsed, version.Version):
-                                continue
-                        except Exception:
-                            continue
-
-                        release_date = None
-                        try:
-                            release_date = datetime.fromisoformat(item.get("release_date", ""))
-                        except Exception:
-                            continue
-
-                        major_minor = ".".join(str(parsed).split('.')[:2])
-                        eol_date = item.get("eol_date") or PYTHON_EOL_DATES.get(major_minor)
-
-                        release_info = PythonReleaseInfo(
-                            version=ver,
-                            major=parsed.major,
-                            minor=parsed.minor,
-                            patch=parsed.micro,
-                            release_date=release_date,
-                            release_notes_url=item.get("release_notes_url", ""),
-                            changelog=item.get("changelog", ""),
-                            is_stable=True,
-                            eol_date=eol_date,
-                            is_major_bump=False,
-                            is_minor_bump=False,
-                        )
-
-                        processed_versions.append(release_info)
-
-                    # mark major/minor bumps
-                    prev = None
-                    for rv in processed_versions:
-                        if prev:
-                            if rv.major > prev.major:
-                                rv.is_major_bump = True
-                            elif rv.minor > prev.minor:
-                                rv.is_minor_bump = True
-                        prev = rv
-
-                    return PythonVersionsListResponse(
-                        versions=processed_versions,
-                        total_count=len(processed_versions),
-                        include_all_releases=include_all_releases,
-                        time_range_years=years,
-                    )
-                except Exception as e:
-                    logger.error(f"Error loading scraped Python versions: {e}")
-                    raise
-            if v.version == to_version:
-                to_info = v
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"GitHub API error: {e}")
-            raise ValueError("Failed to fetch Python versions from GitHub") from e
+            index = await PythonVersionService.get_release_index()
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error(f"Error loading scraped Python versions: {e}")
             raise ValueError("An unexpected error occurred while fetching Python versions") from e
+
+        # An explicit `since` replaces the years window
+        time_range_years = years if since is None else None
+        if since is None:
+            since = (until or datetime.utcnow()) - timedelta(days=years * 365)
+
+        releases = index.query(
+            include_all_releases=include_all_releases,
+            since=since,
+            until=until,
+            series=series,
+        )
+        processed_versions = list(reversed(releases))
+
+        return PythonVersionsListResponse(
+            versions=processed_versions,
+            total_count=len(processed_versions),
+            include_all_releases=include_all_releases,
+            time_range_years=time_range_years,
+            since=since,
+            until=until,
+            series=series,
+        )
+
+    @staticmethod
+    async def compare_versions(
+        from_version: str,
+        to_version: str,
+    ) -> PythonVersionsComparisonResponse:
+        """
+        Compare two stable Python versions.
         
-        if not from_info or not to_info:
-            missing = []
-            if not from_info:
-                missing.append(from_version)
-            if not to_info:
-                missing.append(to_version)
+        Args:
+            from_version: Starting version (e.g., 3.11.0).
+            to_version: Target version (e.g., 3.12.1).
+            
+        Returns:
+            PythonVersionsComparisonResponse with bump counts and summary.
+        """
+        try:
+            index = await PythonVersionService.get_release_index()
+        except Exception as e:
+            logger.error(f"Error loading scraped Python versions: {e}")
+            raise ValueError("An unexpected error occurred while fetching Python versions") from e
+
+        view = index.view(include_all_releases=False)
+        missing = [v for v in (from_version, to_version) if v not in view.positions]
+        if missing:
             raise ValueError(f"Version(s) not found: {', '.join(missing)}")
         
-        # Get versions in between
-        versions_in_between = []
-        from_idx = all_versions.index(from_info)
-        to_idx = all_versions.index(to_info)
-        
-        # Handle both ascending and descending comparisons
-        if from_idx < to_idx:
-            for i in range(from_idx + 1, to_idx):
-                versions_in_between.append(all_versions[i].version)
-        else:
-            for i in range(to_idx + 1, from_idx):
-                versions_in_between.append(all_versions[i].version)
-        
-        # Count version bumps
-        major_bumps = 0
-        minor_bumps = 0
-        patch_bumps = 0
-        
-        if from_idx < to_idx:
-            for i in range(from_idx, to_idx):
-                v1 = all_versions[i]
-                v2 = all_versions[i + 1]
-                
-                if v2.major > v1.major:
-                    major_bumps += 1
-                elif v2.minor > v1.minor:
-                    minor_bumps += 1
-                else:
-                    patch_bumps += 1
-        else:
-            for i in range(to_idx, from_idx):
-                v1 = all_versions[i]
-                v2 = all_versions[i + 1]
-                
-                if v2.major > v1.major:
-                    major_bumps += 1
-                elif v2.minor > v1.minor:
-                    minor_bumps += 1
-                else:
-                    patch_bumps += 1
-        
-        days_between = abs((to_info.release_date - from_info.release_date).days)
-        
-        comparison = VersionComparison(
-            from_version=from_version,
-            to_version=to_version,
-            from_release_date=from_info.release_date,
-            to_release_date=to_info.release_date,
-            days_between=days_between,
-            major_bumps=major_bumps,
-            minor_bumps=minor_bumps,
-            patch_bumps=patch_bumps,
-            versions_in_between=versions_in_between,
-        )
+        comparison = view.compare(from_version, to_version)
         
         changes_summary = (
             f"Between {from_version} and {to_version}: "
-            f"{major_bumps} major bumps, {minor_bumps} minor bumps, {patch_bumps} patch bumps. "
-            f"Released {days_between} days apart. "
-            f"{len(versions_in_between)} versions in between."
+            f"{comparison.major_bumps} major bumps, {comparison.minor_bumps} minor bumps, "
+            f"{comparison.patch_bumps} patch bumps. "
+            f"Released {comparison.days_between} days apart. "
+            f"{len(comparison.versions_in_between)} versions in between."
         )
         
         return PythonVersionsComparisonResponse(
@@ -236,3 +262,44 @@ class PythonVersionService:
             changes_summary=changes_summary,
         )
 
+    @staticmethod
+    async def compare_versions_batch(
+        request: BatchComparisonRequest,
+    ) -> BatchComparisonResponse:
+        """
+        Compare many pairs of stable Python versions in one pass over the index.
+        
+        Args:
+            request: Either explicit (from, to) pairs or a version set to
+                expand into an N x N matrix (row-major, diagonal included).
+            
+        Returns:
+            BatchComparisonResponse with one comparison per resolvable pair.
+            Versions missing from the index are listed in `not_found` and
+            their pairs are skipped.
+        """
+        try:
+            index = await PythonVersionService.get_release_index()
+        except Exception as e:
+            logger.error(f"Error loading scraped Python versions: {e}")
+            raise ValueError("An unexpected error occurred while fetching Python versions") from e
+
+        view = index.view(include_all_releases=False)
+        if request.versions:
+            pairs = [(a, b) for a in request.versions for b in request.versions]
+        else:
+            pairs = request.pairs
+
+        # Up to 10k comparison models; build them off the event loop
+        comparisons, not_found = await asyncio.to_thread(
+            view.compare_many,
+            pairs,
+            request.include_versions_in_between,
+        )
+
+        return BatchComparisonResponse.model_construct(
+            comparisons=comparisons,
+            versions=request.versions,
+            not_found=not_found,
+            total_count=len(comparisons),
+        )
@@ -0,0 +1,213 @@
+"""Sorted in-memory indexes over the full Python release history.
+
+The dataset is loaded once and every list query is answered by bisecting
+sorted keys instead of rescraping or scanning the whole history.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any
+
+from packaging import version
+
+from app.schemas.versions import PythonReleaseInfo, VersionComparison
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime so aware and naive values sort together."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_series(series: str) -> tuple[int, int]:
+    """Parse a ``major.minor`` string such as ``3.12`` into a tuple."""
+    major, minor = series.split(".")
+    return int(major), int(minor)
+
+
+def _prepare_view(rows: list[dict], members: list[int]) -> dict[str, Any]:
+    """Sort one stability slice and compute its bump flags and prefix sums.
+
+    Returns plain lists of row numbers, positions, flags and counts.
+    """
+    keys = {i: version.parse(rows[i]["version"]) for i in members}
+    order = sorted(members, key=keys.__getitem__)
+    releases = [rows[i] for i in order]
+
+    # Bump flags are relative to version order within this view, so the
+    # first 3.13 release is the minor bump whether or not pre-releases count.
+    major_bump = [False] * len(releases)
+    minor_bump = [False] * len(releases)
+    for p in range(1, len(releases)):
+        prev, cur = releases[p - 1], releases[p]
+        major_bump[p] = cur["major"] != prev["major"]
+        minor_bump[p] = cur["major"] == prev["major"] and cur["minor"] != prev["minor"]
+
+    # Prefix sums of bump kinds between consecutive releases in version
+    # order; the bumps between positions i < j are prefix[j] - prefix[i].
+    major_prefix = [0]
+    minor_prefix = [0]
+    patch_prefix = [0]
+    for v1, v2 in zip(releases, releases[1:]):
+        is_major = v2["major"] > v1["major"]
+        is_minor = not is_major and v2["minor"] > v1["minor"]
+        major_prefix.append(major_prefix[-1] + is_major)
+        minor_prefix.append(minor_prefix[-1] + is_minor)
+        patch_prefix.append(patch_prefix[-1] + (not is_major and not is_minor))
+
+    dates = [_naive_utc(r["release_date"]) for r in releases]
+    positions = range(len(releases))
+    return {
+        "order": order,
+        "major_bump": major_bump,
+        "minor_bump": minor_bump,
+        "major_prefix": major_prefix,
+        "minor_prefix": minor_prefix,
+        "patch_prefix": patch_prefix,
+        # Positions into `order`; ties on date keep version order
+        "by_date": sorted(positions, key=lambda p: (dates[p], p)),
+        "by_series": sorted(positions, key=lambda p: (releases[p]["major"], releases[p]["minor"], dates[p], p)),
+    }
+
+
+def prepare_index(rows: list[dict]) -> dict[str, Any]:
+    """Do the CPU-bound part of building a ReleaseIndex.
+
+    ``rows`` hold the PythonReleaseInfo fields other than the bump flags.
+    Only plain lists and dicts come back, so this can run in a worker process.
+    Wrap the result in ``ReleaseIndex`` to get the query objects.
+    """
+    return {
+        "rows": rows,
+        "all": _prepare_view(rows, list(range(len(rows)))),
+        "stable": _prepare_view(rows, [i for i, r in enumerate(rows) if r["is_stable"]]),
+    }
+
+
+class _ReleaseView:
+    """Date and series indexes over one stability slice of the dataset."""
+
+    def __init__(self, rows: list[dict], prepared: dict[str, Any]) -> None:
+        # Rows were validated when prepared; skip re-validation here
+        self.by_version = [
+            PythonReleaseInfo.model_construct(**rows[i], is_major_bump=major, is_minor_bump=minor)
+            for i, major, minor in zip(prepared["order"], prepared["major_bump"], prepared["minor_bump"])
+        ]
+        self.positions = {r.version: i for i, r in enumerate(self.by_version)}
+        self.major_prefix = prepared["major_prefix"]
+        self.minor_prefix = prepared["minor_prefix"]
+        self.patch_prefix = prepared["patch_prefix"]
+
+        self.by_date = [self.by_version[p] for p in prepared["by_date"]]
+        self.dates = [_naive_utc(r.release_date) for r in self.by_date]
+        self.by_series = [self.by_version[p] for p in prepared["by_series"]]
+        self.series_keys = [(r.major, r.minor, _naive_utc(r.release_date)) for r in self.by_series]
+
+    def query(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        series: tuple[int, int] | None = None,
+    ) -> list[PythonReleaseInfo]:
+        """Return releases in ``[since, until]`` (and ``series``), oldest first."""
+        low = _naive_utc(since) if since else datetime.min
+        high = _naive_utc(until) if until else datetime.max
+        if series is None:
+            return self.by_date[bisect_left(self.dates, low):bisect_right(self.dates, high)]
+        major, minor = series
+        start = bisect_left(self.series_keys, (major, minor, low))
+        end = bisect_right(self.series_keys, (major, minor, high))
+        return self.by_series[start:end]
+
+    def compare(
+        self,
+        from_version: str,
+        to_version: str,
+        include_versions_in_between: bool = True,
+    ) -> VersionComparison:
+        """Compare two versions of this view in constant time (plus the in-between slice).
+
+        Raises:
+            KeyError: If either version is not in this view.
+        """
+        from_idx = self.positions[from_version]
+        to_idx = self.positions[to_version]
+        low, high = sorted((from_idx, to_idx))
+        from_info = self.by_version[from_idx]
+        to_info = self.by_version[to_idx]
+
+        return VersionComparison(
+            from_version=from_version,
+            to_version=to_version,
+            from_release_date=from_info.release_date,
+            to_release_date=to_info.release_date,
+            days_between=abs((to_info.release_date - from_info.release_date).days),
+            major_bumps=self.major_prefix[high] - self.major_prefix[low],
+            minor_bumps=self.minor_prefix[high] - self.minor_prefix[low],
+            patch_bumps=self.patch_prefix[high] - self.patch_prefix[low],
+            versions_in_between=(
+                [r.version for r in self.by_version[low + 1:high]]
+                if include_versions_in_between else []
+            ),
+        )
+
+    def compare_many(
+        self,
+        pairs: list[tuple[str, str]],
+        include_versions_in_between: bool = True,
+    ) -> tuple[list[VersionComparison], list[str]]:
+        """Compare each pair, skipping pairs with a version not in this view.
+
+        Returns:
+            The comparisons, and the missing versions in first-seen order.
+        """
+        not_found: dict[str, None] = {}
+        comparisons: list[VersionComparison] = []
+        for from_version, to_version in pairs:
+            missing = [v for v in (from_version, to_version) if v not in self.positions]
+            if missing:
+                not_found.update(dict.fromkeys(missing))
+                continue
+            comparisons.append(self.compare(from_version, to_version, include_versions_in_between))
+        return comparisons, list(not_found)
+
+
+class ReleaseIndex:
+    """Full-history release dataset with sorted secondary indexes.
+
+    Keeps one view over every release and one over stable releases only, each
+    indexed by release date and by ``major.minor`` series. Built from the
+    output of ``prepare_index``.
+    """
+
+    def __init__(self, prepared: dict[str, Any]) -> None:
+        self._all = _ReleaseView(prepared["rows"], prepared["all"])
+        self._stable = _ReleaseView(prepared["rows"], prepared["stable"])
+
+    def __len__(self) -> int:
+        return len(self._all.by_date)
+
+    def view(self, include_all_releases: bool = False) -> _ReleaseView:
+        return self._all if include_all_releases else self._stable
+
+    def query(
+        self,
+        include_all_releases: bool = False,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        series: str | None = None,
+    ) -> list[PythonReleaseInfo]:
+        """Return matching releases, oldest first.
+
+        Args:
+            include_all_releases: If True, include alpha, beta, rc releases.
+            since: Only releases on or after this datetime.
+            until: Only releases on or before this datetime.
+            series: Only releases of this ``major.minor`` series.
+        """
+        return self.view(include_all_releases).query(
+            since=since,
+            until=until,
+            series=parse_series(series) if series else None,
+        )
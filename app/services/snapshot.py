@@ -0,0 +1,139 @@
+"""Versioned binary snapshot of the scraped release dataset.
+
+The snapshot is built ahead of time (for example while the Docker image is
+built) so a fresh container can serve release data before it has scraped
+anything. Layout::
+
+    magic "TTRS" | format version (u16) | reserved (u16) | record count (u32)
+    | SHA-256 of payload (32 bytes) | payload: zlib-compressed JSON list of releases
+
+The whole payload is verified and decoded into release dicts on load, so
+the file is read in one go rather than memory-mapped. What the snapshot
+saves is the network scrape, not the decode.
+
+Build one with::
+
+    python -m app.services.snapshot [--output PATH] [--allow-missing]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"TTRS"
+SNAPSHOT_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHI32s")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing, corrupt or of an unknown format."""
+
+
+def write_snapshot(releases: list[dict], path: Path) -> None:
+    """Write releases to ``path`` atomically."""
+    payload = zlib.compress(
+        json.dumps(releases, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        level=9,
+    )
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_FORMAT_VERSION,
+        0,
+        len(releases),
+        hashlib.sha256(payload).digest(),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Path) -> list[dict]:
+    """Read ``path``, verify it and return its releases.
+
+    Raises:
+        SnapshotError: If the file is missing, truncated, corrupt or of an
+            unsupported format version.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise SnapshotError(f"Could not read snapshot {path}: {e}") from e
+
+    if len(data) < _HEADER.size:
+        raise SnapshotError(f"Snapshot {path} is truncated")
+    magic, format_version, _, count, digest = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError(f"{path} is not a release snapshot")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot format version {format_version}")
+
+    payload = memoryview(data)[_HEADER.size:]
+    if hashlib.sha256(payload).digest() != digest:
+        raise SnapshotError(f"Snapshot {path} failed checksum verification")
+    try:
+        releases = json.loads(zlib.decompress(payload))
+    except (ValueError, zlib.error) as e:
+        raise SnapshotError(f"Could not decode snapshot {path}: {e}") from e
+
+    if len(releases) != count:
+        raise SnapshotError(f"Snapshot {path} holds {len(releases)} releases, header says {count}")
+    return releases
+
+
+async def build_snapshot(path: Path) -> int:
+    """Scrape the full release history and write it to ``path``; return the release count."""
+    from app.services.python_org_scraper import PythonOrgScraper
+
+    releases = await PythonOrgScraper.scrape_and_cache()
+    if not releases:
+        raise SnapshotError("Scrape returned no releases; refusing to write an empty snapshot")
+    write_snapshot(releases, path)
+    return len(releases)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.core.config import settings
+    from app.core.executor import parse_executor
+
+    parser = argparse.ArgumentParser(description="Build the release dataset snapshot.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(settings.snapshot_path),
+        help=f"Snapshot file to write (default: {settings.snapshot_path})",
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Exit successfully without a snapshot if python.org cannot be scraped",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        count = asyncio.run(build_snapshot(args.output))
+    except SnapshotError as e:
+        print(f"Snapshot build failed: {e}", file=sys.stderr)
+        if args.allow_missing:
+            print("Continuing without a snapshot; the app will scrape on first use", file=sys.stderr)
+            return 0
+        return 1
+    finally:
+        parse_executor.shutdown()
+    print(f"Wrote {count} releases to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
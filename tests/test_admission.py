@@ -0,0 +1,195 @@
+"""Tests for admission control: rate limits, queue shedding and client keys."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.admission import AdmissionControlMiddleware, AdmissionStats, _TokenBucket
+
+
+def make_middleware(app=None, **kwargs) -> AdmissionControlMiddleware:
+    async def ok(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    kwargs.setdefault("stats", AdmissionStats())
+    return AdmissionControlMiddleware(app or ok, **kwargs)
+
+
+async def request(
+    middleware: AdmissionControlMiddleware,
+    path: str = "/api/v1/python-versions",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> tuple[int, dict[bytes, bytes]]:
+    """Send one request through the middleware; return the status and headers."""
+    scope = {"type": "http", "path": path, "headers": headers or [], "client": ("10.0.0.1", 1234)}
+    start: dict = {}
+
+    async def send(message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+
+    await middleware(scope, None, send)
+    return start["status"], dict(start["headers"])
+
+
+def blocking_app():
+    """An app whose requests hold their slot until the returned event is set."""
+    release = asyncio.Event()
+
+    async def app(scope, receive, send) -> None:
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app, release
+
+
+def test_token_bucket_refills_at_rate() -> None:
+    bucket = _TokenBucket(capacity=2, now=0.0)
+    assert bucket.take(rate=1.0, capacity=2, now=0.0) == 0
+    assert bucket.take(rate=1.0, capacity=2, now=0.0) == 0
+    assert bucket.take(rate=1.0, capacity=2, now=0.0) == pytest.approx(1.0)
+    assert bucket.take(rate=1.0, capacity=2, now=0.5) == pytest.approx(0.5)
+    assert bucket.take(rate=1.0, capacity=2, now=1.0) == 0
+    # Idle time never refills past capacity
+    assert bucket.take(rate=1.0, capacity=2, now=100.0) == 0
+    assert bucket.take(rate=1.0, capacity=2, now=100.0) == 0
+    assert bucket.take(rate=1.0, capacity=2, now=100.0) > 0
+
+
+def test_rate_limited_client_gets_retry_after() -> None:
+    middleware = make_middleware(rate_per_second=0.25, burst=1, per_client_limit=True)
+
+    async def scenario():
+        return await request(middleware), await request(middleware)
+
+    (first, _), (second, headers) = asyncio.run(scenario())
+    assert (first, second) == (200, 429)
+    # One token at 0.25/s is four seconds away
+    assert headers[b"retry-after"] == b"4"
+    assert middleware.stats.shed_rate_limited == 1
+
+
+def test_rate_limits_are_off_unless_enabled() -> None:
+    middleware = make_middleware(rate_per_second=0.25, burst=1, per_client_limit=False)
+
+    async def scenario():
+        return [await request(middleware) for _ in range(5)]
+
+    assert [status for status, _ in asyncio.run(scenario())] == [200] * 5
+
+
+def test_request_is_shed_after_queue_target() -> None:
+    app, release = blocking_app()
+    middleware = make_middleware(app, max_concurrency=1, queue_target_ms=50)
+
+    async def scenario():
+        holder = asyncio.create_task(request(middleware))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        status, headers = await request(middleware)
+        waited = time.monotonic() - started
+        release.set()
+        await holder
+        return status, headers, waited
+
+    status, headers, waited = asyncio.run(scenario())
+    assert status == 429
+    assert headers[b"retry-after"] == b"1"
+    assert 0.04 <= waited < 1
+    assert middleware.stats.shed_overloaded == 1
+
+
+def test_full_queue_rejects_without_waiting() -> None:
+    app, release = blocking_app()
+    middleware = make_middleware(app, max_concurrency=1, max_queue=1, queue_target_ms=5000)
+
+    async def scenario():
+        holder = asyncio.create_task(request(middleware))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(request(middleware))
+        await asyncio.sleep(0)
+        assert middleware.stats.queued == 1
+        started = time.monotonic()
+        rejected = await request(middleware)
+        waited = time.monotonic() - started
+        release.set()
+        return await holder, await waiter, rejected, waited
+
+    (holder, _), (waiter, _), (rejected, _), waited = asyncio.run(scenario())
+    assert (holder, waiter, rejected) == (200, 200, 429)
+    assert waited < 1
+    assert middleware.stats.shed_overloaded == 1
+
+
+def test_counters_return_to_zero_after_each_request() -> None:
+    app, release = blocking_app()
+    middleware = make_middleware(app, max_concurrency=2, queue_target_ms=5000)
+    stats = middleware.stats
+
+    async def scenario():
+        tasks = [asyncio.create_task(request(middleware)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert (stats.in_flight, stats.queued) == (2, 1)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert [status for status, _ in asyncio.run(scenario())] == [200] * 3
+    assert (stats.admitted, stats.in_flight, stats.queued) == (3, 0, 0)
+
+
+def test_counters_reset_when_the_app_raises() -> None:
+    async def failing(scope, receive, send) -> None:
+        raise RuntimeError("boom")
+
+    middleware = make_middleware(failing)
+    with pytest.raises(RuntimeError):
+        asyncio.run(request(middleware))
+    assert (middleware.stats.in_flight, middleware.stats.queued) == (0, 0)
+    assert not middleware._slots.locked()
+
+
+def test_exempt_paths_bypass_limits() -> None:
+    app, release = blocking_app()
+    release.set()
+    middleware = make_middleware(
+        app,
+        rate_per_second=0.01,
+        burst=1,
+        per_client_limit=True,
+        max_concurrency=1,
+        queue_target_ms=10,
+        exempt_paths=["/api/v1/health"],
+    )
+
+    async def scenario():
+        await middleware._slots.acquire()  # no slots left
+        limited = await request(middleware)
+        exempt = [await request(middleware, "/api/v1/health") for _ in range(3)]
+        return limited, exempt
+
+    (limited, _), exempt = asyncio.run(scenario())
+    assert limited == 429
+    assert [status for status, _ in exempt] == [200] * 3
+    assert middleware.stats.admitted == 0
+
+
+@pytest.mark.parametrize("hops, headers, expected", [
+    (0, [(b"x-forwarded-for", b"6.6.6.6")], "10.0.0.1"),
+    (1, [(b"x-forwarded-for", b"6.6.6.6, 1.1.1.1")], "1.1.1.1"),
+    (2, [(b"x-forwarded-for", b"6.6.6.6, 1.1.1.1, 2.2.2.2")], "1.1.1.1"),
+    (2, [(b"x-forwarded-for", b"6.6.6.6, 1.1.1.1"), (b"x-forwarded-for", b"2.2.2.2")], "1.1.1.1"),
+    (3, [(b"x-forwarded-for", b"1.1.1.1,2.2.2.2"), (b"x-forwarded-for", b"3.3.3.3")], "1.1.1.1"),
+    (2, [(b"x-forwarded-for", b"1.1.1.1")], "10.0.0.1"),
+    (1, [], "10.0.0.1"),
+])
+def test_client_id_uses_nth_forwarded_entry_from_right(hops, headers, expected) -> None:
+    middleware = make_middleware(trusted_proxy_hops=hops)
+    scope = {"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)}
+    assert middleware._client_id(scope) == expected
+
+
+def test_client_id_without_client_address() -> None:
+    assert make_middleware()._client_id({"type": "http", "headers": []}) == "unknown"
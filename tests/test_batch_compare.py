@@ -0,0 +1,132 @@
+"""Tests for prefix-sum version comparisons and the batch compare endpoint."""
+
+import asyncio
+from itertools import product
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.schemas.versions import BatchComparisonRequest
+from app.services.python_versions import PythonVersionService
+from app.services.release_index import ReleaseIndex
+
+RELEASES = [
+    {"version": "2.7.17", "release_date": "2019-10-19T00:00:00"},
+    {"version": "2.7.18", "release_date": "2020-04-20T00:00:00"},
+    {"version": "3.0.0", "release_date": "2008-12-03T00:00:00"},
+    {"version": "3.0.1", "release_date": "2009-02-13T00:00:00"},
+    {"version": "3.1.0", "release_date": "2009-06-27T00:00:00"},
+    {"version": "3.11.0", "release_date": "2022-10-24T00:00:00"},
+    {"version": "3.11.7", "release_date": "2023-12-04T00:00:00"},
+    {"version": "3.12.0", "release_date": "2023-10-02T00:00:00"},
+    {"version": "3.12.0rc1", "release_date": "2023-08-06T00:00:00"},
+    {"version": "3.12.1", "release_date": "2023-12-07T00:00:00"},
+]
+STABLE = ["2.7.17", "2.7.18", "3.0.0", "3.0.1", "3.1.0", "3.11.0", "3.11.7", "3.12.0", "3.12.1"]
+
+
+@pytest.fixture(scope="module")
+def index() -> ReleaseIndex:
+    return PythonVersionService.build_index(RELEASES)
+
+
+@pytest.fixture
+def service_index(index, monkeypatch) -> ReleaseIndex:
+    monkeypatch.setattr(PythonVersionService, "_release_index", index)
+    return index
+
+
+def pairwise_bumps(releases, from_version: str, to_version: str) -> tuple[int, int, int]:
+    """The original walk over consecutive releases, kept as the reference."""
+    names = [r.version for r in releases]
+    low, high = sorted((names.index(from_version), names.index(to_version)))
+    major = minor = patch = 0
+    for v1, v2 in zip(releases[low:high], releases[low + 1:high + 1]):
+        if v2.major > v1.major:
+            major += 1
+        elif v2.minor > v1.minor:
+            minor += 1
+        else:
+            patch += 1
+    return major, minor, patch
+
+
+def test_prefix_sums_match_pairwise_walk_in_both_directions(index: ReleaseIndex) -> None:
+    view = index.view(include_all_releases=False)
+    releases = view.by_version
+    for from_version, to_version in product(STABLE, repeat=2):
+        comparison = view.compare(from_version, to_version)
+        bumps = (comparison.major_bumps, comparison.minor_bumps, comparison.patch_bumps)
+        assert bumps == pairwise_bumps(releases, from_version, to_version), (from_version, to_version)
+
+
+def test_compare_is_symmetric_apart_from_direction(index: ReleaseIndex) -> None:
+    view = index.view(include_all_releases=False)
+    up = view.compare("2.7.18", "3.12.0")
+    down = view.compare("3.12.0", "2.7.18")
+    assert (up.major_bumps, up.minor_bumps, up.patch_bumps) == (1, 3, 2)
+    assert (down.major_bumps, down.minor_bumps, down.patch_bumps) == (1, 3, 2)
+    assert up.versions_in_between == down.versions_in_between == ["3.0.0", "3.0.1", "3.1.0", "3.11.0", "3.11.7"]
+
+
+def test_matrix_diagonal_is_all_zeros(service_index) -> None:
+    request = BatchComparisonRequest(versions=STABLE)
+    response = asyncio.run(PythonVersionService.compare_versions_batch(request))
+
+    assert response.total_count == len(STABLE) ** 2
+    n = len(STABLE)
+    for i in range(n):
+        diagonal = response.comparisons[i * n + i]
+        assert diagonal.from_version == diagonal.to_version == STABLE[i]
+        assert (diagonal.major_bumps, diagonal.minor_bumps, diagonal.patch_bumps) == (0, 0, 0)
+        assert diagonal.days_between == 0
+
+
+def test_matrix_drops_duplicate_versions_and_reports_not_found(service_index) -> None:
+    request = BatchComparisonRequest(versions=["3.12.1", "3.11.0", "3.12.1", "9.9.9", "3.12.0rc1"])
+    assert request.versions == ["3.12.1", "3.11.0", "9.9.9", "3.12.0rc1"]
+
+    response = asyncio.run(PythonVersionService.compare_versions_batch(request))
+    assert response.versions == request.versions
+    # Pre-releases are not in the stable view
+    assert response.not_found == ["9.9.9", "3.12.0rc1"]
+    assert [(c.from_version, c.to_version) for c in response.comparisons] == [
+        ("3.12.1", "3.12.1"), ("3.12.1", "3.11.0"), ("3.11.0", "3.12.1"), ("3.11.0", "3.11.0"),
+    ]
+
+
+def test_pairs_skip_unknown_versions(service_index) -> None:
+    request = BatchComparisonRequest(pairs=[("3.11.0", "3.12.1"), ("3.11.0", "1.0.0")])
+    response = asyncio.run(PythonVersionService.compare_versions_batch(request))
+
+    assert response.total_count == 1
+    assert response.not_found == ["1.0.0"]
+    assert response.versions == []
+
+
+def test_versions_in_between_default_differs_for_pairs_and_matrices(service_index) -> None:
+    pairs = BatchComparisonRequest(pairs=[("3.11.0", "3.12.1")])
+    matrix = BatchComparisonRequest(versions=["3.11.0", "3.12.1"])
+    assert pairs.include_versions_in_between is True
+    assert matrix.include_versions_in_between is False
+
+    pair_result = asyncio.run(PythonVersionService.compare_versions_batch(pairs))
+    matrix_result = asyncio.run(PythonVersionService.compare_versions_batch(matrix))
+    assert pair_result.comparisons[0].versions_in_between == ["3.11.7", "3.12.0"]
+    assert all(c.versions_in_between == [] for c in matrix_result.comparisons)
+
+    explicit = BatchComparisonRequest(versions=["3.11.0", "3.12.1"], include_versions_in_between=True)
+    explicit_result = asyncio.run(PythonVersionService.compare_versions_batch(explicit))
+    assert explicit_result.comparisons[1].versions_in_between == ["3.11.7", "3.12.0"]
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"pairs": [], "versions": []},
+    {"pairs": [["3.11.0", "3.12.1"]], "versions": ["3.11.0"]},
+])
+def test_batch_endpoint_requires_exactly_one_of_pairs_or_versions(body) -> None:
+    from app.main import app
+
+    response = TestClient(app).post("/api/v1/python-versions/compare/batch", json=body)
+    assert response.status_code == 422
@@ -0,0 +1,50 @@
+"""Tests for the parse executor worker pool."""
+
+import asyncio
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core.executor import ParseExecutor
+from app.core.warmup import PARSE_MODULES
+
+
+def crash_worker() -> None:
+    os._exit(1)
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def loaded_modules(names: tuple[str, ...]) -> list[str]:
+    return [name for name in names if name in sys.modules]
+
+
+def test_pool_is_rebuilt_after_a_worker_dies() -> None:
+    executor = ParseExecutor("process", max_workers=1)
+
+    async def scenario() -> int:
+        with pytest.raises(BrokenProcessPool):
+            await executor.run(crash_worker)
+        return await executor.run(square, 7)
+
+    try:
+        assert asyncio.run(scenario()) == 49
+    finally:
+        executor.shutdown()
+    assert executor.stats.pool_restarts == 1
+    assert executor.stats.failed == 1
+    assert executor.stats.pending == 0
+
+
+def test_process_workers_import_parse_modules_on_start() -> None:
+    executor = ParseExecutor("process", max_workers=1)
+    try:
+        executor.warm_up()
+        loaded = asyncio.run(executor.run(loaded_modules, PARSE_MODULES))
+    finally:
+        executor.shutdown()
+    assert loaded == list(PARSE_MODULES)
@@ -0,0 +1,156 @@
+"""Tests for opt-in per-request profiling and the profile admin endpoints."""
+
+import asyncio
+import cProfile
+import pstats
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.executor import ParseExecutor
+from app.core.profiling import ProfileStore, ProfilingMiddleware, has_profiling_token
+
+
+def parse_heavy_page(size: int) -> int:
+    return sum(i * i for i in range(size))
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_executor_work_is_merged_into_the_request_profile(kind, tmp_path, monkeypatch) -> None:
+    executor = ParseExecutor(kind, max_workers=1)
+    store = ProfileStore(tmp_path, max_profiles=5)
+    monkeypatch.setattr("app.core.profiling.has_profiling_token", lambda value: value == "token")
+
+    async def app(scope, receive, send) -> None:
+        await executor.run(parse_heavy_page, 1000)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = ProfilingMiddleware(app, header="X-Profile", store=store)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/python-versions",
+        "headers": [(b"x-profile", b"token")],
+    }
+
+    async def send(message) -> None:
+        pass
+
+    asyncio.run(middleware(scope, None, send))
+    executor.shutdown()
+
+    [profile] = store.list()
+    stats = pstats.Stats(str(tmp_path / profile["name"]))
+    assert any(func == "parse_heavy_page" for _, _, func in stats.stats)
+
+
+
+@pytest.mark.parametrize("value", ["tok\xe9n", "☃", "", None])
+def test_non_ascii_or_missing_tokens_are_rejected(value, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    assert has_profiling_token(value) is False
+
+
+def test_matching_token_is_accepted(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    assert has_profiling_token("token") is True
+
+
+def make_profiler() -> cProfile.Profile:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    parse_heavy_page(10)
+    profiler.disable()
+    return profiler
+
+
+def test_ring_buffer_keeps_only_the_newest_profiles(tmp_path) -> None:
+    store = ProfileStore(tmp_path, max_profiles=2)
+    names = [f"{1000 + i}-GET-api_v1_python-versions.pstats" for i in range(4)]
+    for name in names:
+        store.save(make_profiler(), name)
+
+    assert [p["name"] for p in store.list()] == [names[3], names[2]]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names[2:])
+
+
+@pytest.mark.parametrize("name", [
+    "../secrets.pstats",
+    "..%2Fsecrets.pstats",
+    "/etc/passwd",
+    "1000-GET-missing.pstats",
+    "notes.txt",
+])
+def test_path_for_rejects_traversal_and_unknown_names(name, tmp_path) -> None:
+    store = ProfileStore(tmp_path / "profiles", max_profiles=5)
+    (tmp_path / "secrets.pstats").write_text("secret")
+    assert store.path_for(name) is None
+
+
+def test_path_for_returns_stored_profiles(tmp_path) -> None:
+    store = ProfileStore(tmp_path, max_profiles=5)
+    store.save(make_profiler(), "1000-GET-root.pstats")
+    assert store.path_for("1000-GET-root.pstats") == tmp_path / "1000-GET-root.pstats"
+
+
+def test_profiled_response_carries_profile_id(tmp_path, monkeypatch) -> None:
+    store = ProfileStore(tmp_path, max_profiles=5)
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    sent: list[dict] = []
+
+    async def app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message) -> None:
+        sent.append(message)
+
+    middleware = ProfilingMiddleware(app, header="X-Profile", store=store)
+    for headers in ([(b"x-profile", b"token")], [(b"x-profile", b"wrong")]):
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/python-versions", "headers": headers}
+        asyncio.run(middleware(scope, None, send))
+
+    profiled, unprofiled = sent[0], sent[2]
+    [profile_id] = [v.decode() for k, v in profiled["headers"] if k == b"x-profile-id"]
+    assert store.path_for(profile_id) is not None
+    assert all(k != b"x-profile-id" for k, _ in unprofiled["headers"])
+
+
+@pytest.fixture
+def client() -> TestClient:
+    from app.main import app
+
+    return TestClient(app)
+
+
+def test_admin_endpoints_return_404_when_profiling_disabled(client, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "profiling_enabled", False)
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    headers = {"X-Profile-Token": "token"}
+    assert client.get("/api/v1/admin/profiles", headers=headers).status_code == 404
+    assert client.get("/api/v1/admin/profiles/1000-GET-root.pstats", headers=headers).status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Profile-Token": "wrong"}, {"X-Profile-Token": "tok\xe9n".encode("latin-1")}])
+def test_admin_endpoints_return_403_for_bad_tokens(headers, client, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    assert client.get("/api/v1/admin/profiles", headers=headers).status_code == 403
+    assert client.get("/api/v1/admin/profiles/1000-GET-root.pstats", headers=headers).status_code == 403
+
+
+def test_admin_endpoints_list_and_download_with_token(client, tmp_path, monkeypatch) -> None:
+    store = ProfileStore(tmp_path, max_profiles=5)
+    store.save(make_profiler(), "1000-GET-root.pstats")
+    monkeypatch.setattr("app.api.v1.profiling.profile_store", store)
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_token", "token")
+    headers = {"X-Profile-Token": "token"}
+
+    listing = client.get("/api/v1/admin/profiles", headers=headers).json()
+    assert [p["name"] for p in listing["profiles"]] == ["1000-GET-root.pstats"]
+    download = client.get("/api/v1/admin/profiles/1000-GET-root.pstats", headers=headers)
+    assert download.status_code == 200
+    assert download.content == (tmp_path / "1000-GET-root.pstats").read_bytes()
@@ -0,0 +1,113 @@
+"""Tests for the sorted release indexes behind the release query path."""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from app.services import python_org_scraper
+from app.services.python_org_scraper import CACHE_FORMAT, PythonOrgScraper
+from app.services.python_versions import PythonVersionService
+from app.services.release_index import ReleaseIndex
+
+RELEASES = [
+    {"version": "3.11.0", "release_date": "2022-10-24T00:00:00"},
+    {"version": "3.11.7", "release_date": "2023-12-04T00:00:00"},
+    {"version": "3.12.0", "release_date": "2023-10-02T00:00:00"},
+    {"version": "3.12.1", "release_date": "2023-12-07T00:00:00"},
+    {"version": "3.13.0a1", "release_date": "2023-10-13T00:00:00"},
+    {"version": "3.13.0", "release_date": "2024-10-07T00:00:00"},
+]
+
+
+@pytest.fixture(scope="module")
+def index() -> ReleaseIndex:
+    return PythonVersionService.build_index(RELEASES)
+
+
+def versions(releases) -> list[str]:
+    return [r.version for r in releases]
+
+
+def test_query_returns_oldest_first_and_stable_only_by_default(index: ReleaseIndex) -> None:
+    assert versions(index.query()) == ["3.11.0", "3.12.0", "3.11.7", "3.12.1", "3.13.0"]
+
+
+def test_include_all_releases_adds_prereleases(index: ReleaseIndex) -> None:
+    assert "3.13.0a1" in versions(index.query(include_all_releases=True))
+    assert len(index.query(include_all_releases=True)) == len(RELEASES)
+
+
+def test_since_and_until_are_inclusive(index: ReleaseIndex) -> None:
+    result = index.query(since=datetime(2023, 10, 2), until=datetime(2023, 12, 7))
+    assert versions(result) == ["3.12.0", "3.11.7", "3.12.1"]
+
+
+def test_bounds_just_outside_a_release_exclude_it(index: ReleaseIndex) -> None:
+    result = index.query(since=datetime(2023, 10, 2, 0, 0, 1), until=datetime(2023, 12, 6, 23, 59))
+    assert versions(result) == ["3.11.7"]
+
+
+def test_series_combined_with_dates(index: ReleaseIndex) -> None:
+    assert versions(index.query(series="3.12")) == ["3.12.0", "3.12.1"]
+    assert versions(index.query(series="3.12", since=datetime(2023, 10, 3))) == ["3.12.1"]
+    assert versions(index.query(series="3.12", until=datetime(2023, 10, 2))) == ["3.12.0"]
+    assert index.query(series="3.10") == []
+
+
+def test_series_respects_stability(index: ReleaseIndex) -> None:
+    assert versions(index.query(series="3.13")) == ["3.13.0"]
+    assert versions(index.query(series="3.13", include_all_releases=True)) == ["3.13.0a1", "3.13.0"]
+
+
+def test_minor_bumps_depend_on_the_view(index: ReleaseIndex) -> None:
+    stable = {r.version: r.is_minor_bump for r in index.query()}
+    everything = {r.version: r.is_minor_bump for r in index.query(include_all_releases=True)}
+    assert stable["3.13.0"] is True
+    assert everything["3.13.0a1"] is True
+    assert everything["3.13.0"] is False
+
+
+def test_load_cached_ignores_caches_without_full_history_marker(tmp_path, monkeypatch) -> None:
+    data_file = tmp_path / "python_release_info.json"
+    monkeypatch.setattr(python_org_scraper, "DATA_FILE", data_file)
+
+    data_file.write_text(json.dumps({"generated_at": "2024-01-01", "releases": RELEASES}))
+    assert PythonOrgScraper.load_cached() == []
+
+    data_file.write_text(json.dumps({"format": CACHE_FORMAT, "full_history": True, "releases": RELEASES}))
+    assert PythonOrgScraper.load_cached() == RELEASES
+
+
+def test_concurrent_cold_requests_build_the_index_once(monkeypatch) -> None:
+    monkeypatch.setattr(PythonVersionService, "_release_index", None)
+    monkeypatch.setattr(PythonVersionService, "_index_lock", asyncio.Lock())
+    loads = []
+
+    def load_cached() -> list[dict]:
+        loads.append(1)
+        time.sleep(0.05)
+        return RELEASES
+
+    monkeypatch.setattr(PythonOrgScraper, "load_cached", staticmethod(load_cached))
+
+    async def scenario():
+        return await asyncio.gather(*(PythonVersionService.get_release_index() for _ in range(5)))
+
+    indexes = asyncio.run(scenario())
+    assert len(loads) == 1
+    assert all(index is indexes[0] for index in indexes)
+
+
+def test_time_range_years_reported_only_for_the_years_window(index, monkeypatch) -> None:
+    monkeypatch.setattr(PythonVersionService, "_release_index", index)
+
+    windowed = asyncio.run(PythonVersionService.get_python_versions(years=3, until=datetime(2024, 12, 31)))
+    assert windowed.time_range_years == 3
+    assert windowed.since == datetime(2022, 1, 1)
+
+    explicit = asyncio.run(PythonVersionService.get_python_versions(years=3, since=datetime(2023, 12, 1)))
+    assert explicit.time_range_years is None
+    assert versions(explicit.versions) == ["3.13.0", "3.12.1", "3.11.7"]
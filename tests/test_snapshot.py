@@ -0,0 +1,62 @@
+"""Tests for the baked release snapshot format."""
+
+import struct
+
+import pytest
+
+from app.services import snapshot
+from app.services.snapshot import SnapshotError, read_snapshot, write_snapshot
+
+RELEASES = [
+    {"version": "3.12.0", "release_date": "2023-10-02T00:00:00", "release_notes_url": "", "eol_date": None},
+    {"version": "3.13.0", "release_date": "2024-10-07T00:00:00", "release_notes_url": "", "eol_date": None},
+]
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    path = tmp_path / "releases.snapshot"
+    write_snapshot(RELEASES, path)
+    return path
+
+
+def test_round_trip(snapshot_file) -> None:
+    assert read_snapshot(snapshot_file) == RELEASES
+
+
+def test_missing_file_raises(tmp_path) -> None:
+    with pytest.raises(SnapshotError):
+        read_snapshot(tmp_path / "absent.snapshot")
+
+
+def test_truncated_file_raises(snapshot_file) -> None:
+    snapshot_file.write_bytes(snapshot_file.read_bytes()[:10])
+    with pytest.raises(SnapshotError, match="truncated"):
+        read_snapshot(snapshot_file)
+
+
+def test_bad_checksum_raises(snapshot_file) -> None:
+    data = bytearray(snapshot_file.read_bytes())
+    data[-1] ^= 0xFF
+    snapshot_file.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="checksum"):
+        read_snapshot(snapshot_file)
+
+
+def test_wrong_format_version_raises(snapshot_file) -> None:
+    data = bytearray(snapshot_file.read_bytes())
+    struct.pack_into("<H", data, 4, snapshot.SNAPSHOT_FORMAT_VERSION + 1)
+    snapshot_file.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="format version"):
+        read_snapshot(snapshot_file)
+
+
+def test_allow_missing_exits_cleanly_when_scrape_fails(tmp_path, monkeypatch) -> None:
+    async def empty_scrape(path):
+        raise SnapshotError("Scrape returned no releases")
+
+    monkeypatch.setattr(snapshot, "build_snapshot", empty_scrape)
+    output = tmp_path / "releases.snapshot"
+    assert snapshot.main(["--output", str(output)]) == 1
+    assert snapshot.main(["--output", str(output), "--allow-missing"]) == 0
+    assert not output.exists()
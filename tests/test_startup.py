@@ -0,0 +1,51 @@
+"""Startup import-time regression tests."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.warmup import HEAVY_MODULES
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budget for ``app.main`` in milliseconds
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "1500"))
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@pytest.fixture(scope="module")
+def import_times() -> dict[str, int]:
+    """Run ``python -X importtime -c 'import app.main'`` and map module -> cumulative us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def test_heavy_modules_are_not_imported_at_startup(import_times: dict[str, int]) -> None:
+    top_level = {name.split(".")[0] for name in HEAVY_MODULES}
+    eager = sorted(name for name in import_times if name.split(".")[0] in top_level)
+    assert not eager, f"Heavy modules imported by app.main: {eager}"
+
+
+def test_app_import_within_budget(import_times: dict[str, int]) -> None:
+    assert "app.main" in import_times
+    elapsed_ms = import_times["app.main"] / 1000
+    assert elapsed_ms <= STARTUP_BUDGET_MS, (
+        f"Importing app.main took {elapsed_ms:.0f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)"
+    )